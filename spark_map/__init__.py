@@ -9,13 +9,29 @@ Basic usage:
 For more details, see: https://github.com/yourusername/spark-map
 """
 
-from spark_map.core.analyzer import analyze
-from spark_map.core.findings import Finding, Severity
-from spark_map.core.report import Report
-from spark_map.models.schemas import SparkMetrics, StageMetrics, TaskMetrics
+from typing import TYPE_CHECKING, Any
 
 __version__ = "0.1.0"
 
+if TYPE_CHECKING:
+    from spark_map.core.analyzer import analyze
+    from spark_map.core.findings import Finding, Severity
+    from spark_map.core.report import Report
+    from spark_map.models.schemas import SparkMetrics, StageMetrics, TaskMetrics
+
+# Lazy re-exports (PEP 562): importing spark_map stays cheap - pydantic,
+# numpy, and the detector modules only load when one of these names is
+# actually used. Keeps `spark-map --help`/`doctor` cold-start fast.
+_LAZY_IMPORTS = {
+    "analyze": "spark_map.core.analyzer",
+    "Finding": "spark_map.core.findings",
+    "Severity": "spark_map.core.findings",
+    "Report": "spark_map.core.report",
+    "SparkMetrics": "spark_map.models.schemas",
+    "StageMetrics": "spark_map.models.schemas",
+    "TaskMetrics": "spark_map.models.schemas",
+}
+
 __all__ = [
     # Main entry point
     "analyze",
@@ -30,3 +46,13 @@ __all__ = [
     # Version
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value  # Cache so subsequent lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,5 +1,41 @@
 """CLI commands for Spark Map."""
 
-from spark_map.cli.main import cli
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["cli"]
+if TYPE_CHECKING:
+    from spark_map.cli.main import cli
+
+__all__ = ["cli", "main"]
+
+
+def main() -> None:
+    """Console-script entry point.
+
+    Answers a bare ``--version`` before importing click and the command
+    tree - the flag needs nothing but the version string, so the
+    fast path keeps it at interpreter-startup cost. Everything else
+    goes through the click group as before.
+    """
+    import sys
+
+    if len(sys.argv) == 2 and sys.argv[1] == "--version":
+        from spark_map import __version__
+
+        # Matches click.version_option's output format
+        print(f"spark-map, version {__version__}")
+        return
+
+    from spark_map.cli.main import cli
+
+    cli()
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy re-export (PEP 562), matching the package convention: the
+    # click-based module only loads when the group itself is needed.
+    if name == "cli":
+        from spark_map.cli.main import cli
+
+        globals()["cli"] = cli
+        return cli
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -11,15 +11,27 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 from spark_map import __version__
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Rich is imported lazily so `spark-map --help` and `doctor` don't pay
+# its import cost before printing anything.
+_console = None
+
+
+def _get_console() -> Console:
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
 
 
 @click.group()
@@ -98,6 +110,7 @@ def analyze(
     """
     from spark_map.core.analyzer import analyze as run_analysis
 
+    console = _get_console()
     console.print(f"\n[bold]Spark Map[/bold] v{__version__}\n")
 
     # Validate event log exists
@@ -155,6 +168,7 @@ def diff(before: Path, after: Path) -> None:
 
         spark-map diff --before old.json --after new.json
     """
+    console = _get_console()
     console.print(f"\n[bold]Spark Map Diff[/bold] v{__version__}\n")
     console.print("[yellow]Note:[/yellow] Diff feature coming in v0.2\n")
 
@@ -171,6 +185,9 @@ def doctor() -> None:
 
     Verifies that all required and optional dependencies are available.
     """
+    from rich.table import Table
+
+    console = _get_console()
     console.print(f"\n[bold]Spark Map Doctor[/bold] v{__version__}\n")
 
     checks = []
@@ -224,6 +241,7 @@ def _check_import(module: str, name: str, optional: bool = False) -> tuple[str,
 
 def _create_llm_provider(provider: str, model: str | None, api_key: str | None):
     """Create an LLM provider instance."""
+    console = _get_console()
     if provider == "ollama":
         try:
             from spark_map.explain.ollama import OllamaProvider
@@ -260,9 +278,20 @@ def _create_llm_provider(provider: str, model: str | None, api_key: str | None):
     return None
 
 
+# Keyed by Severity.value so this stays a plain constant and doesn't
+# force the findings module to import at CLI startup.
+_SEVERITY_COLORS = {
+    "critical": "red",
+    "warning": "yellow",
+    "info": "blue",
+}
+
+
 def _display_report(report, metrics_only: bool) -> None:
     """Display report in terminal."""
-    from spark_map.core.findings import Severity
+    from rich.panel import Panel
+
+    console = _get_console()
 
     # Summary panel
     summary_text = (
@@ -281,41 +310,41 @@ def _display_report(report, metrics_only: bool) -> None:
         console.print("\n[green]No performance issues detected![/green]")
         return
 
-    console.print(f"\n[bold]Findings ({len(report.findings)} total)[/bold]\n")
-
-    severity_colors = {
-        Severity.CRITICAL: "red",
-        Severity.WARNING: "yellow",
-        Severity.INFO: "blue",
-    }
+    # Collect the whole findings section and print it once, so Rich
+    # parses markup and reflows a single block rather than per line
+    lines = [f"\n[bold]Findings ({len(report.findings)} total)[/bold]\n"]
 
     for finding in report.findings.sorted_by_severity():
-        color = severity_colors.get(finding.severity, "white")
-        console.print(f"[{color}][{finding.severity}][/{color}] {finding.title}")
+        color = _SEVERITY_COLORS.get(finding.severity.value, "white")
+        lines.append(f"[{color}][{finding.severity}][/{color}] {finding.title}")
         if finding.stage_ids:
-            console.print(f"  [dim]Stages: {finding.stage_ids}[/dim]")
-        console.print(f"  {finding.description[:200]}...")
+            lines.append(f"  [dim]Stages: {finding.stage_ids}[/dim]")
+        lines.append(f"  {finding.description[:200]}...")
         if finding.mitigation_hint:
-            console.print(f"  [green]Hint:[/green] {finding.mitigation_hint}")
+            lines.append(f"  [green]Hint:[/green] {finding.mitigation_hint}")
         if finding.llm_explanation:
-            console.print(f"  [cyan]AI:[/cyan] {finding.llm_explanation[:200]}...")
-        console.print()
+            lines.append(f"  [cyan]AI:[/cyan] {finding.llm_explanation[:200]}...")
+        lines.append("")
+
+    console.print("\n".join(lines))
 
     # LLM summary
     if report.llm_summary:
         console.print(Panel(report.llm_summary, title="AI Summary", border_style="cyan"))
 
 
+_FORMAT_BY_SUFFIX = {
+    ".html": "html",
+    ".htm": "html",
+    ".md": "markdown",
+    ".markdown": "markdown",
+    ".json": "json",
+}
+
+
 def _infer_format(path: Path) -> str:
     """Infer output format from file extension."""
-    suffix = path.suffix.lower()
-    return {
-        ".html": "html",
-        ".htm": "html",
-        ".md": "markdown",
-        ".markdown": "markdown",
-        ".json": "json",
-    }.get(suffix, "text")
+    return _FORMAT_BY_SUFFIX.get(path.suffix.lower(), "text")
 
 
 def _write_output(report, path: Path, format: str) -> None:
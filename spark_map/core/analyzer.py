@@ -4,7 +4,10 @@ Main analysis entry point.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -14,7 +17,9 @@ from spark_map.core.report import Report
 from spark_map.models.schemas import ThresholdConfig
 
 if TYPE_CHECKING:
+    from spark_map.core.detectors.base import BaseDetector
     from spark_map.explain.base import LLMProvider
+    from spark_map.models.schemas import SparkMetrics
 
 
 def analyze(
@@ -74,27 +79,56 @@ def analyze(
     return report
 
 
-def _run_detectors(metrics, thresholds: ThresholdConfig) -> FindingCollection:
-    """Run all bottleneck detectors and collect findings."""
-    from spark_map.core.detectors import get_all_detectors
+def _run_detectors(metrics: SparkMetrics, thresholds: ThresholdConfig) -> FindingCollection:
+    """Run all bottleneck detectors concurrently and collect findings.
 
+    Detectors are independent pure functions over the same immutable
+    metrics, so they parallelize trivially. Threads are enough: the
+    vectorized detectors spend their time in NumPy, which releases the
+    GIL. Results are collected in detector order so output is
+    deterministic regardless of completion order.
+    """
     findings = FindingCollection()
 
-    for detector_cls in get_all_detectors():
-        detector = detector_cls(thresholds=thresholds)
-        detector_findings = detector.detect(metrics)
-        for finding in detector_findings:
-            findings.add(finding)
+    # Materialize the shared columnar view before fanning out so the
+    # workers don't race to build the cached property.
+    if metrics.stages:
+        metrics.stage_arrays  # noqa: B018
+
+    detectors = _detector_instances(thresholds)
+
+    with ThreadPoolExecutor(max_workers=len(detectors)) as executor:
+        for detector_findings in executor.map(lambda d: d.detect(metrics), detectors):
+            for finding in detector_findings:
+                findings.add(finding)
 
     return findings
 
 
+@lru_cache(maxsize=8)
+def _detector_instances(thresholds: ThresholdConfig) -> tuple[BaseDetector, ...]:
+    """Build (and memoize) detector instances for a threshold config.
+
+    Detectors are stateless apart from their thresholds, so a long-lived
+    process serving many analyses reuses the same instances instead of
+    re-instantiating and re-validating per call.
+    """
+    from spark_map.core.detectors import get_all_detectors
+
+    return tuple(detector_cls(thresholds=thresholds) for detector_cls in get_all_detectors())
+
+
 def _add_llm_explanations(report: Report, llm_provider: LLMProvider) -> None:
     """Add LLM-generated explanations to findings and overall summary."""
-    # Generate individual explanations for each finding
-    for finding in report.findings:
-        explanation = llm_provider.explain_finding(finding.to_summary_dict())
-        finding.llm_explanation = explanation
+    # Explain all findings in one batched call (providers fan out
+    # concurrently) instead of one blocking round-trip per finding
+    collection = report.findings
+    findings = collection.findings
+    explanations = llm_provider.explain_findings([f.to_summary_dict() for f in findings])
+    for i, explanation in enumerate(explanations):
+        # Finding is frozen, so swap in an updated copy; replace() also
+        # invalidates the collection's lazy indices
+        collection.replace(i, replace(findings[i], llm_explanation=explanation))
 
     # Generate overall summary
     if report.findings:
@@ -7,11 +7,16 @@ the LLM actual code context for its explanations.
 
 from __future__ import annotations
 
+import functools
 import re
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+# Pattern: "operation at file:line". Compiled once at import; [^:]+ instead
+# of .+ for the file part avoids backtracking on pathological stage names.
+_STAGE_NAME_RE = re.compile(r"^(\w+)\s+at\s+([^:]+):(\d+)$")
+
 
 @dataclass
 class CodeContext:
@@ -47,9 +52,7 @@ def extract_code_location(stage_name: str) -> tuple[str | None, str | None, int
     Returns:
         (operation, file_path, line_number) or (None, None, None) if unparseable
     """
-    # Pattern: "operation at file:line"
-    pattern = r"^(\w+)\s+at\s+(.+):(\d+)$"
-    match = re.match(pattern, stage_name.strip())
+    match = _STAGE_NAME_RE.match(stage_name.strip())
 
     if match:
         operation = match.group(1)
@@ -89,9 +92,8 @@ def get_code_snippet(
     if not resolved_path or not resolved_path.exists():
         return None
 
-    try:
-        lines = resolved_path.read_text(encoding="utf-8").splitlines()
-    except Exception:
+    lines = _read_lines(str(resolved_path))
+    if lines is None:
         return None
 
     # Calculate range (1-indexed to 0-indexed)
@@ -118,6 +120,33 @@ def get_code_snippet(
     )
 
 
+@functools.lru_cache(maxsize=256)
+def _read_lines(path: str) -> tuple[str, ...] | None:
+    """Read and split a source file, memoized by path.
+
+    Many findings typically point into the same job file; caching turns
+    O(findings) file reads into O(unique files).
+    """
+    try:
+        return tuple(Path(path).read_text(encoding="utf-8").splitlines())
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _source_index(source_root: str) -> dict[str, list[Path]]:
+    """Index a source tree by basename with a single directory walk.
+
+    Replaces a recursive rglob per unresolved file (N findings x full
+    tree walk) with one walk shared by all lookups.
+    """
+    index: dict[str, list[Path]] = {}
+    for p in Path(source_root).rglob("*"):
+        if p.is_file():
+            index.setdefault(p.name, []).append(p)
+    return index
+
+
 def _resolve_file_path(file_path: str, source_root: Path | None) -> Path | None:
     """
     Try to resolve a file path to an actual file.
@@ -125,7 +154,7 @@ def _resolve_file_path(file_path: str, source_root: Path | None) -> Path | None:
     Searches in:
     1. Exact path
     2. source_root / file_path
-    3. source_root / **/ file_path (recursive)
+    3. Basename index of source_root (built once per root)
     4. Current directory / file_path
     """
     # Skip stdin and other special paths
@@ -144,8 +173,8 @@ def _resolve_file_path(file_path: str, source_root: Path | None) -> Path | None:
         if candidate.exists():
             return candidate
 
-        # Try recursive search
-        matches = list(source_root.rglob(path.name))
+        # Look up the basename in the (cached) index of the source tree
+        matches = _source_index(str(source_root)).get(path.name, [])
         if len(matches) == 1:
             return matches[0]
 
@@ -157,38 +186,59 @@ def _resolve_file_path(file_path: str, source_root: Path | None) -> Path | None:
     return None
 
 
+_OPERATIONS = [
+    "join",
+    "groupBy",
+    "groupByKey",
+    "reduceByKey",
+    "aggregateByKey",
+    "repartition",
+    "coalesce",
+    "collect",
+    "count",
+    "take",
+    "read",
+    "write",
+    "filter",
+    "map",
+    "flatMap",
+    "distinct",
+    "union",
+    "sort",
+    "orderBy",
+    "cache",
+    "persist",
+    "broadcast",
+]
+
+# One compiled alternation instead of ~20 substring scans per line.
+# Longest-first so e.g. "groupByKey" wins over its prefix "groupBy".
+_OPERATIONS_RE = re.compile(
+    "|".join(re.escape(op) for op in sorted(_OPERATIONS, key=len, reverse=True)),
+    re.IGNORECASE,
+)
+_OPERATION_BY_LOWER = {op.lower(): op for op in _OPERATIONS}
+_OPERATION_RANK = {op.lower(): i for i, op in enumerate(_OPERATIONS)}
+
+
 def _infer_operation(code_line: str) -> str:
-    """Infer the Spark operation from a line of code."""
-    operations = [
-        "join",
-        "groupBy",
-        "groupByKey",
-        "reduceByKey",
-        "aggregateByKey",
-        "repartition",
-        "coalesce",
-        "collect",
-        "count",
-        "take",
-        "read",
-        "write",
-        "filter",
-        "map",
-        "flatMap",
-        "distinct",
-        "union",
-        "sort",
-        "orderBy",
-        "cache",
-        "persist",
-        "broadcast",
-    ]
-
-    code_lower = code_line.lower()
-    for op in operations:
-        if op.lower() in code_lower:
-            return op
+    """Infer the Spark operation from a line of code.
 
+    A line can chain several operations (``df.filter(x).join(y)``);
+    ties are broken by _OPERATIONS order, which ranks the expensive
+    shuffle-heavy operations first, not by position in the line.
+    """
+    best: str | None = None
+    best_rank = len(_OPERATIONS)
+    for match in _OPERATIONS_RE.finditer(code_line):
+        rank = _OPERATION_RANK[match.group(0).lower()]
+        if rank < best_rank:
+            best = match.group(0).lower()
+            best_rank = rank
+            if best_rank == 0:
+                break
+    if best is not None:
+        return _OPERATION_BY_LOWER[best]
     return "unknown"
 
 
@@ -255,3 +305,30 @@ Affected Stages: {stage_ids}
 
 Be specific. Reference the actual variable names and operations in the code.
 """
+
+# The template pre-split at its placeholders once at import, so filling it
+# is plain string concatenation with no per-call format-spec parsing.
+_CODE_AWARE_PARTS = re.split(
+    r"\{(title|severity|stage_ids|description|code_snippets)\}", CODE_AWARE_PROMPT
+)
+
+
+def build_code_aware_prompt(
+    *,
+    title: str,
+    severity: str,
+    stage_ids: list[int],
+    description: str,
+    code_snippets: str,
+) -> str:
+    """Fill CODE_AWARE_PROMPT without going through str.format."""
+    values = {
+        "title": title,
+        "severity": severity,
+        "stage_ids": str(stage_ids),
+        "description": description,
+        "code_snippets": code_snippets,
+    }
+    return "".join(
+        values[part] if i % 2 else part for i, part in enumerate(_CODE_AWARE_PARTS)
+    )
@@ -13,17 +13,21 @@ from spark_map.core.detectors.shuffle import ShuffleExplosionDetector
 from spark_map.core.detectors.skew import SkewDetector
 from spark_map.core.detectors.spill import SpillDetector
 
+# Frozen at import - the detector set is static, so callers share one tuple
+# instead of building a fresh list per analysis.
+_ALL_DETECTORS: tuple[type[BaseDetector], ...] = (
+    SkewDetector,
+    ShuffleExplosionDetector,
+    SpillDetector,
+    PartitionInefficiencyDetector,
+    IOBottleneckDetector,
+    DriverBottleneckDetector,
+)
 
-def get_all_detectors() -> list[type[BaseDetector]]:
+
+def get_all_detectors() -> tuple[type[BaseDetector], ...]:
     """Return all available detector classes."""
-    return [
-        SkewDetector,
-        ShuffleExplosionDetector,
-        SpillDetector,
-        PartitionInefficiencyDetector,
-        IOBottleneckDetector,
-        DriverBottleneckDetector,
-    ]
+    return _ALL_DETECTORS
 
 
 __all__ = [
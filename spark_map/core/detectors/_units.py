@@ -0,0 +1,13 @@
+"""
+Shared byte-unit constants for the detectors.
+
+Hot detector gates compare raw byte counts against thresholds scaled
+into bytes (int compares), and only convert to MB when a finding is
+actually emitted. ``INV_MB`` is an exact power of two, so multiplying
+by it is bit-identical to dividing by ``MB``.
+"""
+
+from __future__ import annotations
+
+MB: int = 1 << 20
+INV_MB: float = 1.0 / MB
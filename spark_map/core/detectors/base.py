@@ -25,6 +25,20 @@ class BaseDetector(ABC):
         self.thresholds = thresholds
 
     @abstractmethod
+    def detect_into(self, metrics: SparkMetrics, out: list[Finding]) -> None:
+        """
+        Analyze metrics and append any findings to ``out``.
+
+        Appending into a caller-provided list lets the orchestrator
+        collect findings from several detectors without an intermediate
+        list allocation and extend-copy per detector.
+
+        Args:
+            metrics: The SparkMetrics to analyze.
+            out: List that detected findings are appended to.
+        """
+        pass
+
     def detect(self, metrics: SparkMetrics) -> list[Finding]:
         """
         Analyze metrics and return any findings.
@@ -35,4 +49,6 @@ class BaseDetector(ABC):
         Returns:
             List of Finding objects, empty if no issues detected.
         """
-        pass
+        out: list[Finding] = []
+        self.detect_into(metrics, out)
+        return out
@@ -6,10 +6,25 @@ Detects when I/O operations dominate stage execution time.
 
 from __future__ import annotations
 
+import numpy as np
+
+from spark_map.core.detectors._units import INV_MB, MB
 from spark_map.core.detectors.base import BaseDetector
 from spark_map.core.findings import Finding, MitigationTag, Severity
 from spark_map.models.schemas import SparkMetrics
 
+# Shared tag tuples - one per finding kind instead of a list per finding
+_SHUFFLE_IO_TAGS = (
+    MitigationTag.BROADCAST_JOIN,
+    MitigationTag.OPTIMIZE_SHUFFLE,
+    MitigationTag.ENABLE_AQE,
+)
+_INPUT_IO_TAGS = (
+    MitigationTag.REPARTITION,
+    MitigationTag.CHECK_DATA_SOURCE,
+    MitigationTag.FILTER_EARLY,
+)
+
 
 class IOBottleneckDetector(BaseDetector):
     """Detect I/O bottlenecks where read time dominates execution."""
@@ -17,86 +32,91 @@ class IOBottleneckDetector(BaseDetector):
     name = "io"
     description = "Detects I/O-bound stages"
 
-    def detect(self, metrics: SparkMetrics) -> list[Finding]:
-        findings: list[Finding] = []
-
-        for stage in metrics.stages:
-            # Skip stages with no duration
-            if stage.duration_ms == 0:
-                continue
+    def detect_into(self, metrics: SparkMetrics, out: list[Finding]) -> None:
+        if not metrics.stages:
+            return
 
-            # Check shuffle read wait time as percentage of stage time
-            # Note: This is imperfect since shuffle read time is per-task but we're looking at stage level
-            if stage.shuffle_read_bytes > 0:
-                # Estimate if shuffle is likely the bottleneck
-                # High shuffle read with long stage duration suggests I/O bound
-                shuffle_per_task_mb = (stage.shuffle_read_bytes / stage.num_tasks) / (1024 * 1024) if stage.num_tasks > 0 else 0
+        # Both checks are gated on the shared columnar view in integer
+        # byte space; only flagged stages pay for the full stage record
+        # and the float MB figures in the descriptions.
+        arrays = metrics.stage_arrays
+        num_tasks = arrays.num_tasks
+        median = arrays.task_duration_median_ms
+        # Stages with no duration are skipped, matching the old loop
+        has_duration = arrays.duration_ms > 0
 
-                # If reading > 100MB per task and stage is slow, likely I/O bound
-                if shuffle_per_task_mb > 100 and stage.task_duration_median_ms > 10000:
-                    findings.append(
-                        Finding(
-                            id=f"io-shuffle-stage-{stage.stage_id}",
-                            detector=self.name,
-                            title=f"Shuffle-bound stage {stage.stage_id}",
-                            severity=Severity.WARNING,
-                            stage_ids=[stage.stage_id],
-                            description=(
-                                f"Stage {stage.stage_id} ({stage.stage_name}) reads "
-                                f"{shuffle_per_task_mb:.1f} MB shuffle data per task on average. "
-                                f"High shuffle read volume can cause network I/O bottlenecks."
-                            ),
-                            metrics={
-                                "shuffle_read_bytes": stage.shuffle_read_bytes,
-                                "shuffle_per_task_mb": round(shuffle_per_task_mb, 2),
-                                "num_tasks": stage.num_tasks,
-                                "median_task_duration_ms": stage.task_duration_median_ms,
-                            },
-                            mitigation_tags=[
-                                MitigationTag.BROADCAST_JOIN,
-                                MitigationTag.OPTIMIZE_SHUFFLE,
-                                MitigationTag.ENABLE_AQE,
-                            ],
-                            mitigation_hint=(
-                                "Consider broadcasting smaller tables to avoid shuffle, "
-                                "or using more partitions to reduce per-task shuffle size."
-                            ),
-                        )
-                    )
+        # Check shuffle read volume per task
+        # Note: This is imperfect since shuffle read time is per-task but we're looking at stage level.
+        # If reading > 100MB per task and stage is slow, likely I/O bound
+        shuffle_mask = (
+            has_duration
+            & (num_tasks > 0)
+            & (arrays.shuffle_read_bytes > 100 * MB * num_tasks)
+            & (median > 10000)
+        )
 
-            # Check input I/O
-            if stage.input_bytes > 0:
-                input_per_task_mb = (stage.input_bytes / stage.num_tasks) / (1024 * 1024) if stage.num_tasks > 0 else 0
+        for i in np.flatnonzero(shuffle_mask):
+            stage = metrics.stages[i]
+            shuffle_per_task_mb = (stage.shuffle_read_bytes / stage.num_tasks) * INV_MB
+            out.append(
+                Finding(
+                    id="io-shuffle-stage-" + str(stage.stage_id),
+                    detector=self.name,
+                    title=f"Shuffle-bound stage {stage.stage_id}",
+                    severity=Severity.WARNING,
+                    stage_ids=[stage.stage_id],
+                    description=(
+                        f"Stage {stage.stage_id} ({stage.stage_name}) reads "
+                        f"{shuffle_per_task_mb:.1f} MB shuffle data per task on average. "
+                        f"High shuffle read volume can cause network I/O bottlenecks."
+                    ),
+                    metrics={
+                        "shuffle_read_bytes": stage.shuffle_read_bytes,
+                        "shuffle_per_task_mb": round(shuffle_per_task_mb, 2),
+                        "num_tasks": stage.num_tasks,
+                        "median_task_duration_ms": stage.task_duration_median_ms,
+                    },
+                    mitigation_tags=_SHUFFLE_IO_TAGS,
+                    mitigation_hint=(
+                        "Consider broadcasting smaller tables to avoid shuffle, "
+                        "or using more partitions to reduce per-task shuffle size."
+                    ),
+                )
+            )
 
-                # If reading > 500MB per task from input, may be I/O bound
-                if input_per_task_mb > 500 and stage.task_duration_median_ms > 30000:
-                    findings.append(
-                        Finding(
-                            id=f"io-input-stage-{stage.stage_id}",
-                            detector=self.name,
-                            title=f"Input I/O bottleneck in stage {stage.stage_id}",
-                            severity=Severity.INFO,
-                            stage_ids=[stage.stage_id],
-                            description=(
-                                f"Stage {stage.stage_id} ({stage.stage_name}) reads "
-                                f"{input_per_task_mb:.1f} MB input data per task. "
-                                f"Large input per task may indicate I/O-bound processing."
-                            ),
-                            metrics={
-                                "input_bytes": stage.input_bytes,
-                                "input_per_task_mb": round(input_per_task_mb, 2),
-                                "num_tasks": stage.num_tasks,
-                            },
-                            mitigation_tags=[
-                                MitigationTag.REPARTITION,
-                                MitigationTag.CHECK_DATA_SOURCE,
-                                MitigationTag.FILTER_EARLY,
-                            ],
-                            mitigation_hint=(
-                                "Consider repartitioning input data, using predicate pushdown, "
-                                "or filtering earlier in the pipeline."
-                            ),
-                        )
-                    )
+        # Check input I/O
+        # If reading > 500MB per task from input, may be I/O bound
+        input_mask = (
+            has_duration
+            & (num_tasks > 0)
+            & (arrays.input_bytes > 500 * MB * num_tasks)
+            & (median > 30000)
+        )
 
-        return findings
+        for i in np.flatnonzero(input_mask):
+            stage = metrics.stages[i]
+            input_per_task_mb = (stage.input_bytes / stage.num_tasks) * INV_MB
+            out.append(
+                Finding(
+                    id="io-input-stage-" + str(stage.stage_id),
+                    detector=self.name,
+                    title=f"Input I/O bottleneck in stage {stage.stage_id}",
+                    severity=Severity.INFO,
+                    stage_ids=[stage.stage_id],
+                    description=(
+                        f"Stage {stage.stage_id} ({stage.stage_name}) reads "
+                        f"{input_per_task_mb:.1f} MB input data per task. "
+                        f"Large input per task may indicate I/O-bound processing."
+                    ),
+                    metrics={
+                        "input_bytes": stage.input_bytes,
+                        "input_per_task_mb": round(input_per_task_mb, 2),
+                        "num_tasks": stage.num_tasks,
+                    },
+                    mitigation_tags=_INPUT_IO_TAGS,
+                    mitigation_hint=(
+                        "Consider repartitioning input data, using predicate pushdown, "
+                        "or filtering earlier in the pipeline."
+                    ),
+                )
+            )
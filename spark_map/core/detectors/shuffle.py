@@ -6,9 +6,23 @@ Detects when shuffle data is disproportionately large compared to input size.
 
 from __future__ import annotations
 
+import numpy as np
+
 from spark_map.core.detectors.base import BaseDetector
 from spark_map.core.findings import Finding, MitigationTag, Severity
-from spark_map.models.schemas import SparkMetrics
+from spark_map.models.schemas import SparkMetrics, ThresholdConfig
+
+# Shared tag tuples - one per finding kind instead of a list per finding
+_EXPLOSION_TAGS = (
+    MitigationTag.BROADCAST_JOIN,
+    MitigationTag.FILTER_EARLY,
+    MitigationTag.OPTIMIZE_SHUFFLE,
+)
+_GLOBAL_SHUFFLE_TAGS = (
+    MitigationTag.CACHE_DATA,
+    MitigationTag.OPTIMIZE_SHUFFLE,
+    MitigationTag.ENABLE_AQE,
+)
 
 
 class ShuffleExplosionDetector(BaseDetector):
@@ -17,57 +31,68 @@ class ShuffleExplosionDetector(BaseDetector):
     name = "shuffle"
     description = "Detects excessive shuffle data relative to input"
 
-    def detect(self, metrics: SparkMetrics) -> list[Finding]:
-        findings: list[Finding] = []
-
-        for stage in metrics.stages:
-            # Need input data to compare against
-            if stage.input_bytes == 0:
-                continue
-
-            # Check shuffle write explosion
-            if stage.shuffle_write_bytes > 0:
-                ratio = stage.shuffle_write_bytes / stage.input_bytes
-
-                if ratio >= self.thresholds.shuffle_explosion_ratio:
-                    severity = Severity.CRITICAL if ratio > self.thresholds.shuffle_explosion_ratio * 2 else Severity.WARNING
-
-                    findings.append(
-                        Finding(
-                            id=f"shuffle-explosion-stage-{stage.stage_id}",
-                            detector=self.name,
-                            title=f"Shuffle explosion in stage {stage.stage_id}",
-                            severity=severity,
-                            stage_ids=[stage.stage_id],
-                            description=(
-                                f"Stage {stage.stage_id} ({stage.stage_name}) wrote {_format_bytes(stage.shuffle_write_bytes)} "
-                                f"to shuffle while reading only {_format_bytes(stage.input_bytes)} input "
-                                f"(ratio: {ratio:.1f}x). This often indicates an exploding join or inefficient aggregation."
-                            ),
-                            metrics={
-                                "input_bytes": stage.input_bytes,
-                                "shuffle_write_bytes": stage.shuffle_write_bytes,
-                                "explosion_ratio": round(ratio, 2),
-                            },
-                            mitigation_tags=[
-                                MitigationTag.BROADCAST_JOIN,
-                                MitigationTag.FILTER_EARLY,
-                                MitigationTag.OPTIMIZE_SHUFFLE,
-                            ],
-                            mitigation_hint=(
-                                "Consider using broadcast joins for small tables, "
-                                "filtering data earlier in the pipeline, or reviewing join conditions."
-                            ),
-                        )
+    def __init__(self, thresholds: ThresholdConfig) -> None:
+        super().__init__(thresholds)
+        # Unpacked once so the per-stage loop reads plain attributes
+        self._explosion_ratio = thresholds.shuffle_explosion_ratio
+        self._explosion_crit_ratio = thresholds.shuffle_explosion_ratio * 2
+
+    def detect_into(self, metrics: SparkMetrics, out: list[Finding]) -> None:
+        # Check shuffle write explosion: one vectorized gate over the
+        # shared columns, reading the float ratio back only for stages
+        # that fire. float64 division matches the old per-stage divide,
+        # so the threshold semantics are unchanged.
+        if metrics.stages:
+            arrays = metrics.stage_arrays
+            input_bytes = arrays.input_bytes
+            ratio = arrays.shuffle_write_bytes / np.maximum(input_bytes, 1)
+            mask = (
+                (input_bytes > 0)
+                & (arrays.shuffle_write_bytes > 0)
+                & (ratio >= self._explosion_ratio)
+            )
+
+            for i in np.flatnonzero(mask):
+                stage = metrics.stages[i]
+                stage_ratio = float(ratio[i])
+                severity = (
+                    Severity.CRITICAL
+                    if stage_ratio > self._explosion_crit_ratio
+                    else Severity.WARNING
+                )
+
+                out.append(
+                    Finding(
+                        id="shuffle-explosion-stage-" + str(stage.stage_id),
+                        detector=self.name,
+                        title=f"Shuffle explosion in stage {stage.stage_id}",
+                        severity=severity,
+                        stage_ids=[stage.stage_id],
+                        description=(
+                            f"Stage {stage.stage_id} ({stage.stage_name}) wrote {_format_bytes(stage.shuffle_write_bytes)} "
+                            f"to shuffle while reading only {_format_bytes(stage.input_bytes)} input "
+                            f"(ratio: {stage_ratio:.1f}x). This often indicates an exploding join or inefficient aggregation."
+                        ),
+                        metrics={
+                            "input_bytes": stage.input_bytes,
+                            "shuffle_write_bytes": stage.shuffle_write_bytes,
+                            "explosion_ratio": round(stage_ratio, 2),
+                        },
+                        mitigation_tags=_EXPLOSION_TAGS,
+                        mitigation_hint=(
+                            "Consider using broadcast joins for small tables, "
+                            "filtering data earlier in the pipeline, or reviewing join conditions."
+                        ),
                     )
+                )
 
         # Also check application-wide shuffle
         if metrics.total_input_bytes > 0:
             total_shuffle = metrics.total_shuffle_read_bytes + metrics.total_shuffle_write_bytes
             total_ratio = total_shuffle / metrics.total_input_bytes
 
-            if total_ratio >= self.thresholds.shuffle_explosion_ratio * 2:
-                findings.append(
+            if total_ratio >= self._explosion_crit_ratio:
+                out.append(
                     Finding(
                         id="shuffle-explosion-global",
                         detector=self.name,
@@ -84,11 +109,7 @@ class ShuffleExplosionDetector(BaseDetector):
                             "total_shuffle_bytes": total_shuffle,
                             "shuffle_ratio": round(total_ratio, 2),
                         },
-                        mitigation_tags=[
-                            MitigationTag.CACHE_DATA,
-                            MitigationTag.OPTIMIZE_SHUFFLE,
-                            MitigationTag.ENABLE_AQE,
-                        ],
+                        mitigation_tags=_GLOBAL_SHUFFLE_TAGS,
                         mitigation_hint=(
                             "Consider caching intermediate results, enabling AQE, "
                             "or restructuring the query to reduce shuffles."
@@ -96,13 +117,18 @@ class ShuffleExplosionDetector(BaseDetector):
                     )
                 )
 
-        return findings
+
+
+_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+_DIVS = tuple(1 << (10 * i) for i in range(6))
 
 
 def _format_bytes(num_bytes: int) -> str:
-    """Format bytes as human-readable string."""
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if abs(num_bytes) < 1024.0:
-            return f"{num_bytes:.1f} {unit}"
-        num_bytes /= 1024.0
-    return f"{num_bytes:.1f} PB"
+    """Format bytes as human-readable string.
+
+    The unit is picked straight from the magnitude's bit length instead
+    of dividing through the unit ladder one step at a time.
+    """
+    magnitude = abs(num_bytes)
+    idx = min((magnitude.bit_length() - 1) // 10, 5) if magnitude else 0
+    return f"{num_bytes / _DIVS[idx]:.1f} {_UNITS[idx]}"
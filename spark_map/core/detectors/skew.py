@@ -7,9 +7,18 @@ indicating data skew or uneven partitioning.
 
 from __future__ import annotations
 
+import numpy as np
+
 from spark_map.core.detectors.base import BaseDetector
 from spark_map.core.findings import Finding, MitigationTag, Severity
-from spark_map.models.schemas import SparkMetrics
+from spark_map.models.schemas import SparkMetrics, ThresholdConfig
+
+# Shared across all skew findings - one tuple instead of a list per finding
+_SKEW_TAGS = (
+    MitigationTag.SALTING,
+    MitigationTag.REPARTITION,
+    MitigationTag.BROADCAST_JOIN,
+)
 
 
 class SkewDetector(BaseDetector):
@@ -18,54 +27,64 @@ class SkewDetector(BaseDetector):
     name = "skew"
     description = "Detects data skew causing uneven task distribution"
 
-    def detect(self, metrics: SparkMetrics) -> list[Finding]:
-        findings: list[Finding] = []
+    def __init__(self, thresholds: ThresholdConfig) -> None:
+        super().__init__(thresholds)
+        # Unpacked once so the per-stage loop reads plain attributes
+        # instead of going through the pydantic model every iteration
+        self._skew_ratio = thresholds.skew_ratio
+        self._skew_crit_ratio = thresholds.skew_ratio * 2
 
-        for stage in metrics.stages:
-            # Skip stages with few tasks (not meaningful)
-            if stage.num_tasks < 10:
-                continue
+    def detect_into(self, metrics: SparkMetrics, out: list[Finding]) -> None:
+        if not metrics.stages:
+            return
 
-            # Skip stages where median is 0 (avoid division by zero)
-            if stage.task_duration_median_ms == 0:
-                continue
+        arrays = metrics.stage_arrays
+        median = arrays.task_duration_median_ms
 
-            ratio = stage.task_duration_max_ms / stage.task_duration_median_ms
+        # One vectorized pass over the shared columns: skip stages with
+        # few tasks (not meaningful) or a zero median (division by zero),
+        # then compare max/median against the skew threshold.
+        ratio = arrays.task_duration_max_ms / np.maximum(median, 1)
+        mask = (
+            (arrays.num_tasks >= 10)
+            & (median > 0)
+            & (ratio >= self._skew_ratio)
+        )
 
-            if ratio >= self.thresholds.skew_ratio:
-                severity = Severity.CRITICAL if ratio > self.thresholds.skew_ratio * 2 else Severity.WARNING
+        for i in np.flatnonzero(mask):
+            stage = metrics.stages[i]
+            stage_ratio = float(ratio[i])
+            severity = (
+                Severity.CRITICAL
+                if stage_ratio > self._skew_crit_ratio
+                else Severity.WARNING
+            )
 
-                findings.append(
-                    Finding(
-                        id=f"skew-stage-{stage.stage_id}",
-                        detector=self.name,
-                        title=f"Data skew detected in stage {stage.stage_id}",
-                        severity=severity,
-                        stage_ids=[stage.stage_id],
-                        description=(
-                            f"Stage {stage.stage_id} ({stage.stage_name}) has significant task duration skew. "
-                            f"Max task took {stage.task_duration_max_ms}ms while median was {stage.task_duration_median_ms}ms "
-                            f"(ratio: {ratio:.1f}x). This typically indicates data skew where some partitions "
-                            f"have much more data than others."
-                        ),
-                        metrics={
-                            "max_task_duration_ms": stage.task_duration_max_ms,
-                            "median_task_duration_ms": stage.task_duration_median_ms,
-                            "p90_task_duration_ms": stage.task_duration_p90_ms,
-                            "p99_task_duration_ms": stage.task_duration_p99_ms,
-                            "skew_ratio": round(ratio, 2),
-                            "num_tasks": stage.num_tasks,
-                        },
-                        mitigation_tags=[
-                            MitigationTag.SALTING,
-                            MitigationTag.REPARTITION,
-                            MitigationTag.BROADCAST_JOIN,
-                        ],
-                        mitigation_hint=(
-                            "Consider salting skewed keys, repartitioning data, "
-                            "or using broadcast joins for small tables."
-                        ),
-                    )
+            out.append(
+                Finding(
+                    id="skew-stage-" + str(stage.stage_id),
+                    detector=self.name,
+                    title=f"Data skew detected in stage {stage.stage_id}",
+                    severity=severity,
+                    stage_ids=[stage.stage_id],
+                    description=(
+                        f"Stage {stage.stage_id} ({stage.stage_name}) has significant task duration skew. "
+                        f"Max task took {stage.task_duration_max_ms}ms while median was {stage.task_duration_median_ms}ms "
+                        f"(ratio: {stage_ratio:.1f}x). This typically indicates data skew where some partitions "
+                        f"have much more data than others."
+                    ),
+                    metrics={
+                        "max_task_duration_ms": stage.task_duration_max_ms,
+                        "median_task_duration_ms": stage.task_duration_median_ms,
+                        "p90_task_duration_ms": stage.task_duration_p90_ms,
+                        "p99_task_duration_ms": stage.task_duration_p99_ms,
+                        "skew_ratio": round(stage_ratio, 2),
+                        "num_tasks": stage.num_tasks,
+                    },
+                    mitigation_tags=_SKEW_TAGS,
+                    mitigation_hint=(
+                        "Consider salting skewed keys, repartitioning data, "
+                        "or using broadcast joins for small tables."
+                    ),
                 )
-
-        return findings
+            )
@@ -6,11 +6,23 @@ Detects memory pressure indicated by spilling data to disk.
 
 from __future__ import annotations
 
+import numpy as np
+
+from spark_map.core.detectors._units import INV_MB, MB
 from spark_map.core.detectors.base import BaseDetector
 from spark_map.core.findings import Finding, MitigationTag, Severity
-from spark_map.models.schemas import SparkMetrics
+from spark_map.models.schemas import SparkMetrics, ThresholdConfig
 
-MB = 1024 * 1024
+# Shared tag tuples - one per finding kind instead of a list per finding
+_STAGE_SPILL_TAGS = (
+    MitigationTag.INCREASE_MEMORY,
+    MitigationTag.REPARTITION,
+    MitigationTag.REDUCE_PARALLELISM,
+)
+_TOTAL_SPILL_TAGS = (
+    MitigationTag.INCREASE_MEMORY,
+    MitigationTag.ENABLE_AQE,
+)
 
 
 class SpillDetector(BaseDetector):
@@ -19,32 +31,47 @@ class SpillDetector(BaseDetector):
     name = "spill"
     description = "Detects memory pressure causing disk spill"
 
-    def detect(self, metrics: SparkMetrics) -> list[Finding]:
-        findings: list[Finding] = []
+    def __init__(self, thresholds: ThresholdConfig) -> None:
+        super().__init__(thresholds)
+        # Thresholds scaled to bytes once so the per-stage gates are
+        # plain integer compares
+        self._min_spill_bytes = thresholds.min_spill_mb * MB
+        self._spill_crit_bytes = self._min_spill_bytes * 10
+        self._spill_warn_bytes = self._min_spill_bytes * 3
+        self._total_spill_bytes = self._min_spill_bytes * 5
+
+    def detect_into(self, metrics: SparkMetrics, out: list[Finding]) -> None:
+        # Most stages don't spill at all, so gate on the shared columnar
+        # view first and only touch the full stage records (and compute
+        # MB figures) for the few that cross the threshold.
+        spill_stage_ids: list[int] = []
+        if metrics.stages:
+            disk = metrics.stage_arrays.disk_bytes_spilled
+            spill_stage_ids = metrics.stage_arrays.stage_ids[disk > 0].tolist()
 
-        # Check per-stage spill
-        for stage in metrics.stages:
-            disk_spill_mb = stage.disk_bytes_spilled / MB
+            # Check per-stage spill
+            for i in np.flatnonzero(disk >= self._min_spill_bytes):
+                stage = metrics.stages[i]
+                disk_spill_mb = stage.disk_bytes_spilled * INV_MB
 
-            if disk_spill_mb >= self.thresholds.min_spill_mb:
                 # Severity based on spill amount
-                if disk_spill_mb > self.thresholds.min_spill_mb * 10:
+                if stage.disk_bytes_spilled > self._spill_crit_bytes:
                     severity = Severity.CRITICAL
-                elif disk_spill_mb > self.thresholds.min_spill_mb * 3:
+                elif stage.disk_bytes_spilled > self._spill_warn_bytes:
                     severity = Severity.WARNING
                 else:
                     severity = Severity.INFO
 
-                findings.append(
+                out.append(
                     Finding(
-                        id=f"spill-stage-{stage.stage_id}",
+                        id="spill-stage-" + str(stage.stage_id),
                         detector=self.name,
                         title=f"Disk spill in stage {stage.stage_id}",
                         severity=severity,
                         stage_ids=[stage.stage_id],
                         description=(
                             f"Stage {stage.stage_id} ({stage.stage_name}) spilled {disk_spill_mb:.1f} MB to disk. "
-                            f"Memory spill was {stage.memory_bytes_spilled / MB:.1f} MB. "
+                            f"Memory spill was {stage.memory_bytes_spilled * INV_MB:.1f} MB. "
                             f"This indicates memory pressure and can significantly slow down execution."
                         ),
                         metrics={
@@ -52,11 +79,7 @@ class SpillDetector(BaseDetector):
                             "memory_bytes_spilled": stage.memory_bytes_spilled,
                             "disk_spill_mb": round(disk_spill_mb, 2),
                         },
-                        mitigation_tags=[
-                            MitigationTag.INCREASE_MEMORY,
-                            MitigationTag.REPARTITION,
-                            MitigationTag.REDUCE_PARALLELISM,
-                        ],
+                        mitigation_tags=_STAGE_SPILL_TAGS,
                         mitigation_hint=(
                             "Consider increasing executor memory (spark.executor.memory), "
                             "reducing partition count, or increasing spark.memory.fraction."
@@ -65,32 +88,27 @@ class SpillDetector(BaseDetector):
                 )
 
         # Check total application spill
-        total_spill_mb = metrics.total_disk_bytes_spilled / MB
-        if total_spill_mb >= self.thresholds.min_spill_mb * 5:
-            findings.append(
+        if metrics.total_disk_bytes_spilled >= self._total_spill_bytes:
+            total_spill_mb = metrics.total_disk_bytes_spilled * INV_MB
+            out.append(
                 Finding(
                     id="spill-total",
                     detector=self.name,
                     title="High total disk spill across application",
                     severity=Severity.WARNING,
-                    stage_ids=[s.stage_id for s in metrics.stages if s.disk_bytes_spilled > 0],
+                    stage_ids=spill_stage_ids,
                     description=(
                         f"Application spilled {total_spill_mb:.1f} MB to disk in total across all stages. "
                         f"This represents significant memory pressure that's impacting performance."
                     ),
                     metrics={
                         "total_disk_spill_mb": round(total_spill_mb, 2),
-                        "stages_with_spill": sum(1 for s in metrics.stages if s.disk_bytes_spilled > 0),
+                        "stages_with_spill": len(spill_stage_ids),
                     },
-                    mitigation_tags=[
-                        MitigationTag.INCREASE_MEMORY,
-                        MitigationTag.ENABLE_AQE,
-                    ],
+                    mitigation_tags=_TOTAL_SPILL_TAGS,
                     mitigation_hint=(
                         "Consider increasing cluster memory or enabling Adaptive Query Execution (AQE) "
                         "to dynamically optimize execution."
                     ),
                 )
             )
-
-        return findings
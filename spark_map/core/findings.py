@@ -4,11 +4,12 @@ Finding and severity models for detected bottlenecks.
 
 from __future__ import annotations
 
+from collections import defaultdict
+from collections.abc import Iterator, Sequence
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
-
 
 class Severity(str, Enum):
     """Severity levels for findings."""
@@ -20,6 +21,15 @@ class Severity(str, Enum):
     def __str__(self) -> str:
         return self.value
 
+    @property
+    def rank(self) -> int:
+        """Integer sort rank: 0 = critical, 2 = info."""
+        return _SEVERITY_RANK[self]
+
+
+# Resolved once at import so sort keys are a dict hit, not a dict build
+_SEVERITY_RANK = {Severity.CRITICAL: 0, Severity.WARNING: 1, Severity.INFO: 2}
+
 
 class MitigationTag(str, Enum):
     """Suggested mitigation strategies."""
@@ -42,42 +52,44 @@ class MitigationTag(str, Enum):
         return self.value
 
 
-class Finding(BaseModel):
-    """A detected performance issue with supporting evidence."""
+@dataclass(frozen=True, slots=True)
+class Finding:
+    """A detected performance issue with supporting evidence.
+
+    A plain frozen dataclass rather than a pydantic model: findings are
+    constructed in detector inner loops from values we computed
+    ourselves, so there is nothing to validate, and __slots__ keeps the
+    per-instance footprint small when large apps emit hundreds of them.
+    """
 
     # Identity
-    id: str = Field(description="Unique finding identifier (e.g., 'skew-stage-5')")
-    detector: str = Field(description="Name of detector that found this (e.g., 'skew')")
+    id: str  # Unique finding identifier (e.g., 'skew-stage-5')
+    detector: str  # Name of detector that found this (e.g., 'skew')
 
     # Classification
-    title: str = Field(description="Short, human-readable title")
-    severity: Severity = Field(description="How serious is this issue")
+    title: str  # Short, human-readable title
+    severity: Severity  # How serious is this issue
+
+    # Evidence
+    description: str  # Detailed explanation of the finding
 
     # Location
-    stage_ids: list[int] = Field(default_factory=list, description="Affected stage IDs")
+    stage_ids: list[int] = field(default_factory=list)  # Affected stage IDs
 
-    # Evidence
-    description: str = Field(description="Detailed explanation of the finding")
-    metrics: dict[str, Any] = Field(
-        default_factory=dict,
-        description="Raw metrics that triggered this finding",
-    )
-
-    # Suggestions
-    mitigation_tags: list[MitigationTag] = Field(
-        default_factory=list,
-        description="Suggested mitigation strategies",
-    )
-    mitigation_hint: str = Field(
-        default="",
-        description="Brief human-readable suggestion",
-    )
+    # Raw metrics that triggered this finding
+    metrics: dict[str, Any] = field(default_factory=dict)
+
+    # Suggestions. Sequence so detectors can pass shared module-level
+    # tuples (one per finding kind) instead of a fresh list per finding.
+    mitigation_tags: Sequence[MitigationTag] = ()
+    mitigation_hint: str = ""  # Brief human-readable suggestion
 
     # LLM explanation (populated later if LLM is enabled)
-    llm_explanation: str | None = Field(
-        default=None,
-        description="LLM-generated explanation (if enabled)",
-    )
+    llm_explanation: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a full dict representation for serialization."""
+        return asdict(self)
 
     def to_summary_dict(self) -> dict[str, Any]:
         """Return a dict suitable for LLM consumption (no raw metrics)."""
@@ -93,26 +105,83 @@ class Finding(BaseModel):
         }
 
 
-class FindingCollection(BaseModel):
-    """Collection of findings with helper methods."""
+class FindingCollection:
+    """Collection of findings with helper methods.
+
+    Lookups by severity, detector, and stage are backed by dict indices
+    built lazily in a single pass and invalidated on ``add()``, so the
+    rendering code can query buckets repeatedly without rescanning the
+    whole list each time.
+    """
 
-    findings: list[Finding] = Field(default_factory=list)
+    def __init__(self, findings: list[Finding] | None = None) -> None:
+        self.findings: list[Finding] = findings if findings is not None else []
+        self._sev_idx: dict[Severity, list[Finding]] | None = None
+        self._det_idx: dict[str, list[Finding]] | None = None
+        self._stage_idx: dict[int, list[Finding]] | None = None
 
     def add(self, finding: Finding) -> None:
         """Add a finding to the collection."""
         self.findings.append(finding)
+        self._invalidate()
+
+    def replace(self, index: int, finding: Finding) -> None:
+        """Swap in a new finding at ``index``.
+
+        Findings are frozen, so updates (e.g. attaching an LLM
+        explanation) arrive as replacement objects; going through here
+        keeps the lazy indices consistent with the list.
+        """
+        self.findings[index] = finding
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        """Drop the lazy indices after any mutation."""
+        self._sev_idx = None
+        self._det_idx = None
+        self._stage_idx = None
+
+    def _build_indices(
+        self,
+    ) -> tuple[
+        dict[Severity, list[Finding]],
+        dict[str, list[Finding]],
+        dict[int, list[Finding]],
+    ]:
+        """Build all three indices in one pass over the findings."""
+        sev_idx: dict[Severity, list[Finding]] = defaultdict(list)
+        det_idx: dict[str, list[Finding]] = defaultdict(list)
+        stage_idx: dict[int, list[Finding]] = defaultdict(list)
+        for f in self.findings:
+            sev_idx[f.severity].append(f)
+            det_idx[f.detector].append(f)
+            for stage_id in f.stage_ids:
+                stage_idx[stage_id].append(f)
+        self._sev_idx = sev_idx
+        self._det_idx = det_idx
+        self._stage_idx = stage_idx
+        return sev_idx, det_idx, stage_idx
 
     def by_severity(self, severity: Severity) -> list[Finding]:
         """Get findings filtered by severity."""
-        return [f for f in self.findings if f.severity == severity]
+        idx = self._sev_idx
+        if idx is None:
+            idx, _, _ = self._build_indices()
+        return idx.get(severity, [])
 
     def by_detector(self, detector: str) -> list[Finding]:
         """Get findings from a specific detector."""
-        return [f for f in self.findings if f.detector == detector]
+        idx = self._det_idx
+        if idx is None:
+            _, idx, _ = self._build_indices()
+        return idx.get(detector, [])
 
     def by_stage(self, stage_id: int) -> list[Finding]:
         """Get findings affecting a specific stage."""
-        return [f for f in self.findings if stage_id in f.stage_ids]
+        idx = self._stage_idx
+        if idx is None:
+            _, _, idx = self._build_indices()
+        return idx.get(stage_id, [])
 
     @property
     def critical(self) -> list[Finding]:
@@ -130,12 +199,18 @@ class FindingCollection(BaseModel):
         return self.by_severity(Severity.INFO)
 
     def sorted_by_severity(self) -> list[Finding]:
-        """Return findings sorted by severity (critical first)."""
-        order = {Severity.CRITICAL: 0, Severity.WARNING: 1, Severity.INFO: 2}
-        return sorted(self.findings, key=lambda f: order[f.severity])
+        """Return findings sorted by severity (critical first).
+
+        There are only three severities, so a stable single-pass bucket
+        split replaces the O(n log n) comparison sort.
+        """
+        buckets: tuple[list[Finding], ...] = ([], [], [])
+        for f in self.findings:
+            buckets[f.severity.rank].append(f)
+        return buckets[0] + buckets[1] + buckets[2]
 
     def __len__(self) -> int:
         return len(self.findings)
 
-    def __iter__(self):
+    def __iter__(self) -> Iterator[Finding]:
         return iter(self.findings)
@@ -4,10 +4,10 @@ Report class that holds analysis results and supports multiple output formats.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import orjson
 from pydantic import BaseModel, Field
 
 from spark_map.core.findings import Finding, FindingCollection
@@ -96,7 +96,7 @@ class Report(BaseModel):
                 "num_critical": len(self.findings.critical),
                 "num_warnings": len(self.findings.warnings),
             },
-            "findings": [f.model_dump() for f in self.findings.sorted_by_severity()],
+            "findings": [f.to_dict() for f in self.findings.sorted_by_severity()],
         }
 
         if include_raw_metrics:
@@ -109,26 +109,33 @@ class Report(BaseModel):
         return data
 
     def to_json(self, path: str | Path, indent: int = 2, include_raw_metrics: bool = True) -> None:
-        """Export report as JSON file."""
+        """Export report as JSON file.
+
+        Note: indentation is either off (indent=0) or 2 spaces - orjson
+        only supports 2-space indent, which is all we need here.
+        """
         path = Path(path)
         data = self.to_dict(include_raw_metrics=include_raw_metrics)
-        path.write_text(json.dumps(data, indent=indent, default=str))
+        option = orjson.OPT_INDENT_2 if indent else 0
+        path.write_bytes(orjson.dumps(data, option=option, default=str))
 
     def to_html(self, path: str | Path) -> None:
-        """Export report as HTML file."""
-        from spark_map.render.html import render_html
+        """Export report as HTML file, streaming chunk by chunk."""
+        from spark_map.render.html import iter_html_chunks
 
         path = Path(path)
-        html_content = render_html(self)
-        path.write_text(html_content)
+        with open(path, "w", encoding="utf-8") as f:
+            f.writelines(iter_html_chunks(self))
 
     def to_markdown(self, path: str | Path) -> None:
-        """Export report as Markdown file."""
-        from spark_map.render.markdown import render_markdown
+        """Export report as Markdown file, streaming line by line."""
+        from spark_map.render.markdown import iter_markdown_lines
 
         path = Path(path)
-        md_content = render_markdown(self)
-        path.write_text(md_content)
+        with open(path, "w", encoding="utf-8") as f:
+            for line in iter_markdown_lines(self):
+                f.write(line)
+                f.write("\n")
 
     def get_findings_for_llm(self) -> list[dict[str, Any]]:
         """Get findings in a format suitable for LLM consumption."""
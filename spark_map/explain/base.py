@@ -7,9 +7,19 @@ behavior and output.
 
 from __future__ import annotations
 
+import hashlib
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import orjson
+
+# Explanations keyed by (provider name, finding digest). Module-level so
+# repeated analyze() calls in one process reuse answers even when the
+# provider object is rebuilt; identical findings across similar runs of
+# the same job then skip the LLM round-trip entirely.
+_EXPLANATION_CACHE: dict[tuple[str, str], str] = {}
+
 
 class LLMProvider(ABC):
     """
@@ -43,6 +53,56 @@ class LLMProvider(ABC):
         """
         pass
 
+    def explain_findings(self, finding_summaries: list[dict[str, Any]]) -> list[str]:
+        """
+        Generate explanations for several findings at once.
+
+        The cost here is request latency, not CPU, so the default fans
+        out explain_finding on a small thread pool instead of making N
+        sequential round-trips. Providers with a true batch endpoint can
+        override this with a single request.
+
+        Findings already explained by this provider in this process are
+        served from a cache keyed on their summary content, so only the
+        genuinely new findings hit the network.
+
+        Args:
+            finding_summaries: List of finding summary dicts (see
+                explain_finding for the expected keys).
+
+        Returns:
+            Explanations in the same order as the input findings.
+        """
+        if not finding_summaries:
+            return []
+
+        results: list[str | None] = [None] * len(finding_summaries)
+        misses: list[int] = []
+        keys: list[tuple[str, str]] = []
+        for i, summary in enumerate(finding_summaries):
+            key = (self.name, _summary_digest(summary))
+            keys.append(key)
+            cached = _EXPLANATION_CACHE.get(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                misses.append(i)
+
+        if misses:
+            max_workers = min(8, len(misses))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                fresh = executor.map(
+                    self.explain_finding, [finding_summaries[i] for i in misses]
+                )
+            for i, explanation in zip(misses, fresh, strict=True):
+                results[i] = explanation
+                # Provider errors come back as "(... error: ...)" strings;
+                # don't pin those - the next run should retry
+                if not explanation.startswith("("):
+                    _EXPLANATION_CACHE[keys[i]] = explanation
+
+        return results  # type: ignore[return-value]
+
     @abstractmethod
     def summarize(self, analysis_summary: dict[str, Any]) -> str:
         """
@@ -61,6 +121,48 @@ class LLMProvider(ABC):
         """
         pass
 
+    @staticmethod
+    def _format_explain_prompt(finding_summary: dict[str, Any]) -> str:
+        """Fill the finding-explanation prompt from a summary dict.
+
+        Shared by all providers so the field extraction lives in one
+        place; provider subclasses only differ in how they send it.
+        """
+        get = finding_summary.get
+        return FINDING_EXPLANATION_PROMPT.format(
+            title=get("title", ""),
+            severity=get("severity", ""),
+            detector=get("detector", ""),
+            stage_ids=get("stage_ids", []),
+            description=get("description", ""),
+            mitigation_tags=get("mitigation_tags", []),
+            mitigation_hint=get("mitigation_hint", ""),
+        )
+
+    @staticmethod
+    def _format_summary_prompt(analysis_summary: dict[str, Any]) -> str:
+        """Fill the report-summary prompt from an analysis summary dict."""
+        findings = analysis_summary.get("findings", [])
+        findings_text = "\n".join(
+            f"- [{f.get('severity', 'info')}] {f.get('title', 'Unknown')}"
+            for f in findings[:10]  # Limit to top 10
+        )
+        return SUMMARY_PROMPT.format(
+            app_name=analysis_summary.get("app_name", "Unknown"),
+            app_id=analysis_summary.get("app_id", "Unknown"),
+            duration_ms=analysis_summary.get("duration_ms", 0),
+            num_stages=analysis_summary.get("num_stages", 0),
+            findings_text=findings_text or "No significant issues detected.",
+        )
+
+
+def _summary_digest(finding_summary: dict[str, Any]) -> str:
+    """Stable content hash of a finding summary for cache keying."""
+    return hashlib.blake2b(
+        orjson.dumps(finding_summary, option=orjson.OPT_SORT_KEYS, default=str),
+        digest_size=16,
+    ).hexdigest()
+
 
 FINDING_EXPLANATION_PROMPT = """You are a Spark performance expert helping engineers understand performance issues.
 
@@ -9,11 +9,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from spark_map.explain.base import (
-    FINDING_EXPLANATION_PROMPT,
-    SUMMARY_PROMPT,
-    LLMProvider,
-)
+from spark_map.explain.base import LLMProvider
 
 
 class OllamaProvider(LLMProvider):
@@ -52,15 +48,7 @@ class OllamaProvider(LLMProvider):
 
     def explain_finding(self, finding_summary: dict[str, Any]) -> str:
         """Generate explanation for a finding using Ollama."""
-        prompt = FINDING_EXPLANATION_PROMPT.format(
-            title=finding_summary.get("title", ""),
-            severity=finding_summary.get("severity", ""),
-            detector=finding_summary.get("detector", ""),
-            stage_ids=finding_summary.get("stage_ids", []),
-            description=finding_summary.get("description", ""),
-            mitigation_tags=finding_summary.get("mitigation_tags", []),
-            mitigation_hint=finding_summary.get("mitigation_hint", ""),
-        )
+        prompt = self._format_explain_prompt(finding_summary)
 
         try:
             response = self._client.generate(
@@ -74,19 +62,7 @@ class OllamaProvider(LLMProvider):
 
     def summarize(self, analysis_summary: dict[str, Any]) -> str:
         """Generate overall summary using Ollama."""
-        findings = analysis_summary.get("findings", [])
-        findings_text = "\n".join(
-            f"- [{f.get('severity', 'info')}] {f.get('title', 'Unknown')}"
-            for f in findings[:10]  # Limit to top 10
-        )
-
-        prompt = SUMMARY_PROMPT.format(
-            app_name=analysis_summary.get("app_name", "Unknown"),
-            app_id=analysis_summary.get("app_id", "Unknown"),
-            duration_ms=analysis_summary.get("duration_ms", 0),
-            num_stages=analysis_summary.get("num_stages", 0),
-            findings_text=findings_text or "No significant issues detected.",
-        )
+        prompt = self._format_summary_prompt(analysis_summary)
 
         try:
             response = self._client.generate(
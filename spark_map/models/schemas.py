@@ -7,6 +7,10 @@ and analysis results.
 
 from __future__ import annotations
 
+from dataclasses import dataclass
+from functools import cached_property
+
+import numpy as np
 from pydantic import BaseModel, Field
 
 
@@ -98,6 +102,29 @@ class StageMetrics(BaseModel):
     num_failed_tasks: int = Field(default=0, ge=0, description="Number of failed tasks")
 
 
+@dataclass(frozen=True)
+class StageArrays:
+    """
+    Column-oriented (structure-of-arrays) view of per-stage metrics.
+
+    Built once per SparkMetrics and shared by all detectors, so each
+    detector reads contiguous int64 arrays instead of re-traversing the
+    list of pydantic models attribute-by-attribute.
+    """
+
+    stage_ids: np.ndarray
+    num_tasks: np.ndarray
+    duration_ms: np.ndarray
+    task_duration_median_ms: np.ndarray
+    task_duration_max_ms: np.ndarray
+    input_bytes: np.ndarray
+    output_bytes: np.ndarray
+    shuffle_read_bytes: np.ndarray
+    shuffle_write_bytes: np.ndarray
+    memory_bytes_spilled: np.ndarray
+    disk_bytes_spilled: np.ndarray
+
+
 class SparkMetrics(BaseModel):
     """Top-level metrics for an entire Spark application."""
 
@@ -131,9 +158,36 @@ class SparkMetrics(BaseModel):
     total_shuffle_write_bytes: int = Field(default=0, ge=0, description="Total shuffle write")
     total_disk_bytes_spilled: int = Field(default=0, ge=0, description="Total disk spill")
 
+    @cached_property
+    def stage_arrays(self) -> StageArrays:
+        """Columnar view of the stages list, built lazily on first access."""
+
+        def column(name: str) -> np.ndarray:
+            return np.array([getattr(s, name) for s in self.stages], dtype=np.int64)
+
+        return StageArrays(
+            stage_ids=column("stage_id"),
+            num_tasks=column("num_tasks"),
+            duration_ms=column("duration_ms"),
+            task_duration_median_ms=column("task_duration_median_ms"),
+            task_duration_max_ms=column("task_duration_max_ms"),
+            input_bytes=column("input_bytes"),
+            output_bytes=column("output_bytes"),
+            shuffle_read_bytes=column("shuffle_read_bytes"),
+            shuffle_write_bytes=column("shuffle_write_bytes"),
+            memory_bytes_spilled=column("memory_bytes_spilled"),
+            disk_bytes_spilled=column("disk_bytes_spilled"),
+        )
+
 
 class ThresholdConfig(BaseModel):
-    """Configurable thresholds for bottleneck detection."""
+    """Configurable thresholds for bottleneck detection.
+
+    Frozen (and therefore hashable) so detector instances can be
+    memoized per configuration and shared safely across threads.
+    """
+
+    model_config = {"frozen": True}
 
     # Skew detection
     skew_ratio: float = Field(
@@ -1,6 +1,26 @@
 """Output rendering for Spark Map reports."""
 
-from spark_map.render.html import render_html
-from spark_map.render.markdown import render_markdown
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from spark_map.render.html import render_html
+    from spark_map.render.markdown import render_markdown
+
+# Lazy re-exports (PEP 562), matching the top-level package: importing
+# spark_map.render no longer loads both renderer modules up front.
+_LAZY_IMPORTS = {
+    "render_html": "spark_map.render.html",
+    "render_markdown": "spark_map.render.markdown",
+}
 
 __all__ = ["render_html", "render_markdown"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value  # Cache so subsequent lookups skip __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
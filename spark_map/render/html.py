@@ -6,6 +6,7 @@ Generates a standalone HTML report with embedded CSS styling.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -15,11 +16,18 @@ from spark_map.core.findings import Severity
 
 
 def render_html(report: Report) -> str:
-    """Render a report as HTML."""
-    findings_html = _render_findings(report)
-    metrics_html = _render_metrics(report)
+    """Render a report as a single HTML string."""
+    return "".join(iter_html_chunks(report))
 
-    return f"""<!DOCTYPE html>
+
+def iter_html_chunks(report: Report) -> Iterator[str]:
+    """Yield the HTML report in chunks - one per finding / stage row.
+
+    Lets writers stream straight to a file instead of materializing the
+    whole document in memory first; with thousands of findings the
+    high-water mark stays at one chunk.
+    """
+    yield f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -70,12 +78,16 @@ def render_html(report: Report) -> str:
 
         <section class="findings">
             <h2>Findings</h2>
-            {findings_html}
+            """
+    yield from _iter_findings(report)
+    yield """
         </section>
 
         <section class="metrics">
             <h2>Stage Metrics</h2>
-            {metrics_html}
+            """
+    yield from _iter_metrics(report)
+    yield """
         </section>
     </main>
 
@@ -86,10 +98,11 @@ def render_html(report: Report) -> str:
 </html>"""
 
 
-def _render_findings(report: Report) -> str:
-    """Render findings section."""
+def _iter_findings(report: Report) -> Iterator[str]:
+    """Yield the findings section, one chunk per finding."""
     if not report.findings:
-        return '<p class="no-findings">No performance issues detected.</p>'
+        yield '<p class="no-findings">No performance issues detected.</p>'
+        return
 
     severity_classes = {
         Severity.CRITICAL: "critical",
@@ -97,8 +110,7 @@ def _render_findings(report: Report) -> str:
         Severity.INFO: "info",
     }
 
-    findings_html = []
-    for finding in report.findings.sorted_by_severity():
+    for i, finding in enumerate(report.findings.sorted_by_severity()):
         severity_class = severity_classes.get(finding.severity, "info")
         stages = ", ".join(str(s) for s in finding.stage_ids) if finding.stage_ids else "N/A"
 
@@ -109,7 +121,9 @@ def _render_findings(report: Report) -> str:
                 <strong>AI Explanation:</strong> {finding.llm_explanation}
             </div>'''
 
-        findings_html.append(f'''
+        if i:
+            yield "\n"
+        yield f'''
         <div class="finding {severity_class}">
             <div class="finding-header">
                 <span class="severity-badge">{finding.severity.value.upper()}</span>
@@ -126,29 +140,12 @@ def _render_findings(report: Report) -> str:
                     {" ".join(f'<span class="tag">{tag}</span>' for tag in finding.mitigation_tags)}
                 </div>
             </div>
-        </div>''')
+        </div>'''
 
-    return "\n".join(findings_html)
 
-
-def _render_metrics(report: Report) -> str:
-    """Render stage metrics table."""
-    rows = []
-    for stage in report.metrics.stages:
-        rows.append(f'''
-        <tr>
-            <td>{stage.stage_id}</td>
-            <td>{stage.stage_name[:40]}...</td>
-            <td>{stage.num_tasks}</td>
-            <td>{stage.duration_ms / 1000:.1f}s</td>
-            <td>{stage.task_duration_median_ms}ms</td>
-            <td>{stage.task_duration_max_ms}ms</td>
-            <td>{_format_bytes(stage.shuffle_read_bytes)}</td>
-            <td>{_format_bytes(stage.shuffle_write_bytes)}</td>
-            <td>{_format_bytes(stage.disk_bytes_spilled)}</td>
-        </tr>''')
-
-    return f'''
+def _iter_metrics(report: Report) -> Iterator[str]:
+    """Yield the stage metrics table, one chunk per row."""
+    yield '''
     <table class="metrics-table">
         <thead>
             <tr>
@@ -164,7 +161,21 @@ def _render_metrics(report: Report) -> str:
             </tr>
         </thead>
         <tbody>
-            {"".join(rows)}
+            '''
+    for stage in report.metrics.stages:
+        yield f'''
+        <tr>
+            <td>{stage.stage_id}</td>
+            <td>{stage.stage_name[:40]}...</td>
+            <td>{stage.num_tasks}</td>
+            <td>{stage.duration_ms / 1000:.1f}s</td>
+            <td>{stage.task_duration_median_ms}ms</td>
+            <td>{stage.task_duration_max_ms}ms</td>
+            <td>{_format_bytes(stage.shuffle_read_bytes)}</td>
+            <td>{_format_bytes(stage.shuffle_write_bytes)}</td>
+            <td>{_format_bytes(stage.disk_bytes_spilled)}</td>
+        </tr>'''
+    yield '''
         </tbody>
     </table>'''
 
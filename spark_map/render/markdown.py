@@ -6,6 +6,7 @@ Generates a Markdown report suitable for documentation or GitHub.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -13,9 +14,19 @@ if TYPE_CHECKING:
 
 
 def render_markdown(report: Report) -> str:
-    """Render a report as Markdown."""
-    lines = [
-        f"# Spark Map Report",
+    """Render a report as a single Markdown string."""
+    return "\n".join(iter_markdown_lines(report))
+
+
+def iter_markdown_lines(report: Report) -> Iterator[str]:
+    """Yield the Markdown report line by line.
+
+    Lets writers stream straight to a file instead of materializing the
+    whole report in memory first - with thousands of stages the stage
+    table alone can run to megabytes.
+    """
+    yield from [
+        "# Spark Map Report",
         "",
         f"**Application:** {report.metrics.app_name or report.metrics.app_id}",
         f"**Generated:** {report.analysis_timestamp}",
@@ -24,8 +35,8 @@ def render_markdown(report: Report) -> str:
         "",
         "## Summary",
         "",
-        f"| Metric | Value |",
-        f"|--------|-------|",
+        "| Metric | Value |",
+        "|--------|-------|",
         f"| Duration | {report.metrics.total_duration_ms / 1000:.1f}s |",
         f"| Stages | {report.metrics.num_stages} ({report.metrics.num_failed_stages} failed) |",
         f"| Tasks | {report.metrics.num_tasks} ({report.metrics.num_failed_tasks} failed) |",
@@ -38,26 +49,26 @@ def render_markdown(report: Report) -> str:
 
     # LLM Summary
     if report.llm_summary:
-        lines.extend([
+        yield from [
             "## AI Summary",
             "",
             f"> Generated by {report.llm_provider}",
             "",
             report.llm_summary,
             "",
-        ])
+        ]
 
     # Findings
-    lines.extend([
+    yield from [
         "## Findings",
         "",
-    ])
+    ]
 
     if not report.findings:
-        lines.append("No performance issues detected.")
+        yield "No performance issues detected."
     else:
-        lines.append(f"Found **{len(report.findings)}** issues:")
-        lines.append("")
+        yield f"Found **{len(report.findings)}** issues:"
+        yield ""
 
         for finding in report.findings.sorted_by_severity():
             severity_emoji = {
@@ -68,7 +79,7 @@ def render_markdown(report: Report) -> str:
 
             stages = ", ".join(str(s) for s in finding.stage_ids) if finding.stage_ids else "N/A"
 
-            lines.extend([
+            yield from [
                 f"### {severity_emoji} {finding.title}",
                 "",
                 f"**Severity:** {finding.severity.value.upper()}  ",
@@ -77,49 +88,47 @@ def render_markdown(report: Report) -> str:
                 "",
                 finding.description,
                 "",
-            ])
+            ]
 
             if finding.llm_explanation:
-                lines.extend([
+                yield from [
                     "**AI Explanation:**",
                     f"> {finding.llm_explanation}",
                     "",
-                ])
+                ]
 
-            lines.extend([
+            yield from [
                 f"**Suggestion:** {finding.mitigation_hint}",
                 "",
                 f"**Tags:** {', '.join(f'`{tag}`' for tag in finding.mitigation_tags)}",
                 "",
                 "---",
                 "",
-            ])
+            ]
 
     # Stage Metrics Table
-    lines.extend([
+    yield from [
         "## Stage Metrics",
         "",
         "| Stage | Name | Tasks | Duration | Median | Max | Shuffle R | Shuffle W | Spill |",
         "|-------|------|-------|----------|--------|-----|-----------|-----------|-------|",
-    ])
+    ]
 
     for stage in report.metrics.stages:
         name = stage.stage_name[:30] + "..." if len(stage.stage_name) > 30 else stage.stage_name
-        lines.append(
+        yield (
             f"| {stage.stage_id} | {name} | {stage.num_tasks} | "
             f"{stage.duration_ms / 1000:.1f}s | {stage.task_duration_median_ms}ms | "
             f"{stage.task_duration_max_ms}ms | {_format_bytes(stage.shuffle_read_bytes)} | "
             f"{_format_bytes(stage.shuffle_write_bytes)} | {_format_bytes(stage.disk_bytes_spilled)} |"
         )
 
-    lines.extend([
+    yield from [
         "",
         "---",
         "",
         "*Generated by [Spark Map](https://github.com/yourusername/spark-map)*",
-    ])
-
-    return "\n".join(lines)
+    ]
 
 
 def _format_bytes(num_bytes: int) -> str:
@@ -1,7 +1,10 @@
 """Tests for CLI commands."""
 
+import pytest
 from click.testing import CliRunner
 
+from spark_map import __version__
+from spark_map.cli import main
 from spark_map.cli.main import cli
 
 
@@ -46,3 +49,25 @@ def test_analyze_missing_file():
     runner = CliRunner()
     result = runner.invoke(cli, ["analyze", "--event-log", "/nonexistent/file.json"])
     assert result.exit_code != 0
+
+
+def test_main_version_fast_path(monkeypatch, capsys):
+    """Test that main() answers --version without going through click."""
+    monkeypatch.setattr("sys.argv", ["spark-map", "--version"])
+    main()
+    out = capsys.readouterr().out
+
+    # Must be byte-identical to what click's version_option prints
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--version"])
+    assert out == result.output
+    assert out == f"spark-map, version {__version__}\n"
+
+
+def test_main_dispatches_to_cli(monkeypatch, capsys):
+    """Test that anything but a bare --version falls through to the group."""
+    monkeypatch.setattr("sys.argv", ["spark-map", "--help"])
+    with pytest.raises(SystemExit) as excinfo:
+        main()
+    assert excinfo.value.code == 0
+    assert "analyze" in capsys.readouterr().out
@@ -1,12 +1,13 @@
 """Tests for event log parser."""
 
+import gzip
 import json
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from spark_map.core.parser import parse_eventlog
+from spark_map.core.parser import parse_eventlog, parse_eventlogs
 
 
 @pytest.fixture
@@ -143,6 +144,71 @@ def test_parse_empty_eventlog():
     assert metrics.num_stages == 0
 
 
+def _write_minimal_eventlog(path, app_id):
+    """Write a tiny valid event log with the given application ID."""
+    events = [
+        {"Event": "SparkListenerApplicationStart", "App ID": app_id, "Timestamp": 1000},
+        {"Event": "SparkListenerApplicationEnd", "Timestamp": 2000},
+    ]
+    with open(path, "w") as f:
+        for event in events:
+            f.write(json.dumps(event) + "\n")
+
+
+def test_parse_eventlogs_preserves_order(tmp_path):
+    """Test that results come back in the same order as the input paths."""
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"app-{i}.json"
+        _write_minimal_eventlog(path, f"app-{i}")
+        paths.append(path)
+
+    results = parse_eventlogs(paths)
+    assert [m.app_id for m in results] == ["app-0", "app-1", "app-2"]
+
+    # Reversed input comes back reversed
+    results = parse_eventlogs(list(reversed(paths)))
+    assert [m.app_id for m in results] == ["app-2", "app-1", "app-0"]
+
+
+def test_parse_eventlogs_single_and_empty(tmp_path):
+    """Test the inline fallback for zero or one path."""
+    assert parse_eventlogs([]) == []
+
+    path = tmp_path / "only.json"
+    _write_minimal_eventlog(path, "only-app")
+    results = parse_eventlogs([path])
+    assert len(results) == 1
+    assert results[0].app_id == "only-app"
+
+
+def test_parse_gzipped_eventlog(sample_eventlog):
+    """Test that a gzipped log parses identically to its plain counterpart."""
+    gz_path = Path(str(sample_eventlog) + ".gz")
+    with gzip.open(gz_path, "wb") as f:
+        f.write(sample_eventlog.read_bytes())
+
+    plain = parse_eventlog(sample_eventlog)
+    compressed = parse_eventlog(gz_path)
+
+    assert compressed.model_dump() == plain.model_dump()
+
+
+def test_parse_json_array_eventlog():
+    """Test parsing of logs stored as a single JSON array."""
+    events = [
+        {"Event": "SparkListenerApplicationStart", "App ID": "app-arr", "Timestamp": 1000},
+        {"Event": "SparkListenerApplicationEnd", "Timestamp": 2000},
+    ]
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
+        json.dump(events, f, indent=2)
+        path = Path(f.name)
+
+    metrics = parse_eventlog(path)
+    assert metrics.app_id == "app-arr"
+    assert metrics.total_duration_ms == 1000
+
+
 def test_parse_malformed_lines():
     """Test that malformed JSON lines are skipped."""
     with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f: